@@ -2,9 +2,12 @@
 from __future__ import annotations
 
 import argparse
+import atexit
 import json
 import logging
+import multiprocessing
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
@@ -39,10 +42,12 @@ def build_parser() -> argparse.ArgumentParser:
 
     subparsers.add_parser("build-manifest", help="Build document completeness manifest")
     subparsers.add_parser("acquire-missing", help="Attempt to fetch missing public documents")
-    subparsers.add_parser("normalize-corpus", help="Normalize available documents and emit chunks")
+    normalize_parser = subparsers.add_parser("normalize-corpus", help="Normalize available documents and emit chunks")
+    normalize_parser.add_argument("--workers", type=int, default=None, help="Worker processes for cleaning (1 runs serially)")
 
     index_parser = subparsers.add_parser("build-index", help="Build Chroma and DuckDB artifacts")
     index_parser.add_argument("--embedding-model", default=None, help="Embedding model name or 'hash' for tests")
+    index_parser.add_argument("--rebuild", action="store_true", help="Re-embed every chunk instead of only changed ones")
 
     search_parser = subparsers.add_parser("search", help="Search the indexed corpus")
     search_parser.add_argument("--question", required=True)
@@ -95,11 +100,22 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def configure_logging() -> QueueListener:
+    # A multiprocessing queue, so forked pool workers that inherit this handler reach the listener too.
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s | %(levelname)s | %(name)s | %(message)s"))
+    log_queue: multiprocessing.Queue[logging.LogRecord] = multiprocessing.Queue(-1)
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
 def main() -> int:
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
-    )
+    configure_logging()
     parser = build_parser()
     args = parser.parse_args()
     paths = CorpusPaths(
@@ -115,9 +131,9 @@ def main() -> int:
     elif args.command == "acquire-missing":
         payload = [row.as_dict() for row in acquire_missing(paths=paths)]
     elif args.command == "normalize-corpus":
-        payload = normalize_corpus(paths=paths)
+        payload = normalize_corpus(paths=paths, max_workers=args.workers)
     elif args.command == "build-index":
-        payload = build_index(paths=paths, embedding_model=args.embedding_model)
+        payload = build_index(paths=paths, embedding_model=args.embedding_model, rebuild=args.rebuild)
     elif args.command == "search":
         filters = {
             key: value
@@ -5,21 +5,35 @@ import argparse
 import json
 import math
 import re
+import sys
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterable
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import requests
 
 ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.ai_corpus.public_sources import (
+    FDIC_FETCH_WORKERS,
+    FDIC_MAX_REQUESTS_PER_SECOND,
+    RateLimiter,
+    build_session,
+)
+
 AI_CORPUS_DIR = ROOT / "artifacts" / "ai_corpus"
 FFIEC_DIR = ROOT / "artifacts" / "ffiec_bulk"
 OUTPUT_DIR = ROOT / "artifacts" / "april_1_ai_team"
 ROSTER_CSV = ROOT / "AI_Bank_Classification.csv"
 
-COMMON_PERIODS = [
+COMMON_PERIODS: tuple[tuple[int, int], ...] = (
     (2024, 1),
     (2024, 2),
     (2024, 3),
@@ -28,7 +42,8 @@ COMMON_PERIODS = [
     (2025, 2),
     (2025, 3),
     (2025, 4),
-]
+)
+COMMON_PERIOD_SET = frozenset(COMMON_PERIODS)
 
 FFIEC_REQUIRED_FILES = [
     "FFIEC-CDR-Call-Bulk-All-Schedules-03312024.zip",
@@ -138,6 +153,8 @@ FDIC_FINANCIAL_FIELDS = [
     "DEPUNINS",
     "LNLSNET",
 ]
+FDIC_CERT_FILTER_BATCH_SIZE = 50
+ARROW_CSV_MIN_ROWS = 100_000
 
 
 def parse_args() -> argparse.Namespace:
@@ -175,6 +192,18 @@ def safe_divide(numerator: pd.Series, denominator: pd.Series) -> pd.Series:
     return result
 
 
+def write_frame_csv(frame: pd.DataFrame, path: Path) -> None:
+    if len(frame) < ARROW_CSV_MIN_ROWS:
+        frame.to_csv(path, index=False)
+        return
+    try:
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        frame.to_csv(path, index=False)
+        return
+    pacsv.write_csv(table, str(path))
+
+
 def sparse_percentile(values: pd.Series) -> pd.Series:
     values = pd.to_numeric(values, errors="coerce").fillna(0.0)
     result = pd.Series(0.0, index=values.index)
@@ -239,7 +268,7 @@ def recent_summary(frame: pd.DataFrame, prefix: str, value_column: str, breadth_
     return pd.DataFrame(rows)
 
 
-def full_period_grid(roster: pd.DataFrame, periods: list[tuple[int, int]]) -> pd.DataFrame:
+def full_period_grid(roster: pd.DataFrame, periods: tuple[tuple[int, int], ...]) -> pd.DataFrame:
     rows = []
     for item in roster.itertuples(index=False):
         for year, quarter in periods:
@@ -262,30 +291,30 @@ def load_roster() -> pd.DataFrame:
 
 
 def load_fdic_cert_mapping(roster: pd.DataFrame) -> pd.DataFrame:
-    session = requests.Session()
+    mapping = roster.copy()
+    mapping["cert"] = mapping["Ticker"].map(FDIC_CERT_MAP)
+    certs = sorted({int(cert) for cert in mapping["cert"].dropna()})
+    session = build_session()
     institution_rows: list[dict[str, object]] = []
-    offset = 0
-    limit = 10000
-    while True:
+    for start in range(0, len(certs), FDIC_CERT_FILTER_BATCH_SIZE):
+        batch = certs[start : start + FDIC_CERT_FILTER_BATCH_SIZE]
         response = session.get(
             "https://api.fdic.gov/banks/institutions",
             params={
                 "format": "json",
-                "limit": limit,
-                "offset": offset,
+                "limit": len(batch),
                 "fields": "NAME,CERT,NAMEHCR,CITY,STALP,ACTIVE,ASSET",
+                "filters": " OR ".join(f"CERT:{cert}" for cert in batch),
             },
             timeout=60,
         )
         response.raise_for_status()
         payload = response.json()
         institution_rows.extend(item["data"] for item in payload.get("data", []))
-        offset += limit
-        if offset >= int(payload.get("meta", {}).get("total", 0)):
-            break
-    institutions = pd.DataFrame(institution_rows)
-    mapping = roster.copy()
-    mapping["cert"] = mapping["Ticker"].map(FDIC_CERT_MAP)
+    institutions = pd.DataFrame(
+        institution_rows,
+        columns=["NAME", "CERT", "NAMEHCR", "CITY", "STALP", "ACTIVE", "ASSET"],
+    )
     mapping = mapping.merge(institutions, left_on="cert", right_on="CERT", how="left")
     mapping = mapping.rename(
         columns={
@@ -407,7 +436,7 @@ def build_private_credit_quarterly(roster: pd.DataFrame) -> tuple[pd.DataFrame,
         for line in infile:
             chunk = json.loads(line)
             period = (int(chunk["period_year"]), int(chunk["period_quarter"]))
-            if period not in COMMON_PERIODS:
+            if period not in COMMON_PERIOD_SET:
                 continue
             text = str(chunk["chunk_text"])
             for family, (pattern, weight) in PRIVATE_CREDIT_PATTERNS.items():
@@ -511,45 +540,64 @@ def build_private_credit_quarterly(roster: pd.DataFrame) -> tuple[pd.DataFrame,
     return hits_df, private_credit, current
 
 
+def _fetch_cert_financials(
+    session: requests.Session,
+    limiter: RateLimiter,
+    ticker: str,
+    bank_name: str,
+    cert: int,
+) -> list[dict[str, object]]:
+    limiter.wait()
+    response = session.get(
+        "https://api.fdic.gov/banks/financials",
+        params={
+            "format": "json",
+            "limit": 200,
+            "sort_by": "REPDTE",
+            "sort_order": "DESC",
+            "fields": ",".join(FDIC_FINANCIAL_FIELDS),
+            "filters": f"CERT:{cert}",
+        },
+        timeout=60,
+    )
+    response.raise_for_status()
+    payload = response.json()
+    rows: list[dict[str, object]] = []
+    for result in payload.get("data", []):
+        data = result.get("data", {})
+        repdte = str(data.get("REPDTE", ""))
+        if len(repdte) != 8 or not repdte.isdigit():
+            continue
+        year = int(repdte[:4])
+        quarter = month_to_quarter(int(repdte[4:6]))
+        if (year, quarter) not in COMMON_PERIOD_SET:
+            continue
+        row = {
+            "ticker": ticker,
+            "bank_name": bank_name,
+            "cert": cert,
+            "period_year": year,
+            "period_quarter": quarter,
+            "period_label": period_label(year, quarter),
+            "risk_report_date": repdte,
+        }
+        for field in FDIC_FINANCIAL_FIELDS:
+            row[field] = data.get(field)
+        rows.append(row)
+    return rows
+
+
 def fetch_fdic_financials(cert_map: pd.DataFrame) -> pd.DataFrame:
-    session = requests.Session()
+    session = build_session()
+    limiter = RateLimiter(FDIC_MAX_REQUESTS_PER_SECOND)
     rows: list[dict[str, object]] = []
-    for item in cert_map.itertuples(index=False):
-        response = session.get(
-            "https://api.fdic.gov/banks/financials",
-            params={
-                "format": "json",
-                "limit": 200,
-                "sort_by": "REPDTE",
-                "sort_order": "DESC",
-                "fields": ",".join(FDIC_FINANCIAL_FIELDS),
-                "filters": f"CERT:{item.cert}",
-            },
-            timeout=60,
-        )
-        response.raise_for_status()
-        payload = response.json()
-        for result in payload.get("data", []):
-            data = result.get("data", {})
-            repdte = str(data.get("REPDTE", ""))
-            if len(repdte) != 8 or not repdte.isdigit():
-                continue
-            year = int(repdte[:4])
-            quarter = month_to_quarter(int(repdte[4:6]))
-            if (year, quarter) not in COMMON_PERIODS:
-                continue
-            row = {
-                "ticker": item.ticker,
-                "bank_name": item.bank_name,
-                "cert": item.cert,
-                "period_year": year,
-                "period_quarter": quarter,
-                "period_label": period_label(year, quarter),
-                "risk_report_date": repdte,
-            }
-            for field in FDIC_FINANCIAL_FIELDS:
-                row[field] = data.get(field)
-            rows.append(row)
+    with ThreadPoolExecutor(max_workers=FDIC_FETCH_WORKERS) as executor:
+        futures = [
+            executor.submit(_fetch_cert_financials, session, limiter, item.ticker, item.bank_name, item.cert)
+            for item in cert_map.itertuples(index=False)
+        ]
+        for future in futures:
+            rows.extend(future.result())
     fdic = pd.DataFrame(rows)
     fdic = numeric_frame(
         fdic,
@@ -602,7 +650,7 @@ def build_ffiec_dpd(cert_map: pd.DataFrame) -> pd.DataFrame:
         year = int(mmddyyyy[-4:])
         month = int(mmddyyyy[:2])
         quarter = month_to_quarter(month)
-        if (year, quarter) not in COMMON_PERIODS:
+        if (year, quarter) not in COMMON_PERIOD_SET:
             continue
         with zipfile.ZipFile(zip_path) as archive:
             por_name = f"FFIEC CDR Call Bulk POR {mmddyyyy}.txt"
@@ -990,7 +1038,7 @@ def write_manual_ai_files(
         ]
         if path.exists()
     ]
-    pd.DataFrame(upload_rows).to_csv(upload_manifest, index=False)
+    write_frame_csv(pd.DataFrame(upload_rows), upload_manifest)
 
     priority_lines = "\n".join(
         f"- {row.ticker}: {row.bank_name}" for row in priority.head(12).itertuples(index=False)
@@ -1126,7 +1174,7 @@ def main() -> None:
 
     roster = load_roster()
     cert_map = load_fdic_cert_mapping(roster)
-    cert_map.to_csv(output_dir / "fdic_cert_mapping.csv", index=False)
+    write_frame_csv(cert_map, output_dir / "fdic_cert_mapping.csv")
 
     ai_quarterly, ai_current = build_ai_quarterly(roster)
     private_credit_hits, private_credit_quarterly, private_credit_current = build_private_credit_quarterly(roster)
@@ -1222,17 +1270,17 @@ def main() -> None:
 
     priority = build_manual_ai_priority(current_ratings, risk_current)
 
-    current_ratings.to_csv(output_dir / "workstream_current_ratings.csv", index=False)
-    quarterly_ratings.to_csv(output_dir / "workstream_quarterly_ratings.csv", index=False)
-    clusters.to_csv(output_dir / "workstream_clusters.csv", index=False)
-    drivers.to_csv(output_dir / "workstream_driver_correlations.csv", index=False)
-    ai_quarterly.to_csv(output_dir / "ai_quarterly_scores.csv", index=False)
-    private_credit_quarterly.to_csv(output_dir / "private_credit_quarterly_scores.csv", index=False)
-    risk_quarterly.to_csv(output_dir / "risk_quarterly_scores.csv", index=False)
-    private_credit_hits.to_csv(output_dir / "private_credit_hits.csv", index=False)
-    fdic_financials.to_csv(output_dir / "fdic_quarterly_financials.csv", index=False)
-    ffiec_dpd.to_csv(output_dir / "ffiec_dpd_metrics.csv", index=False)
-    priority.to_csv(output_dir / "manual_ai_priority_banks.csv", index=False)
+    write_frame_csv(current_ratings, output_dir / "workstream_current_ratings.csv")
+    write_frame_csv(quarterly_ratings, output_dir / "workstream_quarterly_ratings.csv")
+    write_frame_csv(clusters, output_dir / "workstream_clusters.csv")
+    write_frame_csv(drivers, output_dir / "workstream_driver_correlations.csv")
+    write_frame_csv(ai_quarterly, output_dir / "ai_quarterly_scores.csv")
+    write_frame_csv(private_credit_quarterly, output_dir / "private_credit_quarterly_scores.csv")
+    write_frame_csv(risk_quarterly, output_dir / "risk_quarterly_scores.csv")
+    write_frame_csv(private_credit_hits, output_dir / "private_credit_hits.csv")
+    write_frame_csv(fdic_financials, output_dir / "fdic_quarterly_financials.csv")
+    write_frame_csv(ffiec_dpd, output_dir / "ffiec_dpd_metrics.csv")
+    write_frame_csv(priority, output_dir / "manual_ai_priority_banks.csv")
 
     workbook_path = output_dir / "risk_resilience_index_detail.xlsx"
     with pd.ExcelWriter(workbook_path, engine="openpyxl") as writer:
@@ -15,7 +15,6 @@ from typing import Any, Iterable
 from zipfile import ZipFile
 
 import yaml
-from openpyxl import Workbook
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
 if str(ROOT_DIR) not in sys.path:
@@ -34,6 +33,8 @@ SEC_10K_HTML_RE = re.compile(
 SEC_10K_FULL_RE = re.compile(
     r"^data/sec-edgar-filings/([^/]+)/10-K/[^/]*_10-K_(\d{4})_Q([1-4])/full-submission\.txt$"
 )
+COMPANY_NAME_RE = re.compile(rb"^\s*COMPANY CONFORMED NAME:\s*(.+?)\s*$", re.M)
+FULL_SUBMISSION_HEADER_BYTES = 4096
 
 ANCHOR_PATTERNS = [
     re.compile(r"\bartificial intelligence\b", re.I),
@@ -46,6 +47,7 @@ ANCHOR_PATTERNS = [
     re.compile(r"\bcopilot(s)?\b", re.I),
     re.compile(r"\bai\b", re.I),
 ]
+ANCHOR_RE = re.compile("|".join(pattern.pattern for pattern in ANCHOR_PATTERNS), re.I)
 
 EXPLICIT_TERMS = {
     "strategy",
@@ -262,7 +264,7 @@ def clean_transcript_text(text: str) -> str:
     return shared_clean_transcript_text(text)
 
 
-def clean_10k_html(text: str) -> str:
+def clean_10k_html(text: str | bytes) -> str:
     return shared_clean_sec_html(text)
 
 
@@ -346,10 +348,9 @@ def analyze_rule_signals(text: str, config: dict[str, Any]) -> RuleAnalysis:
     category_priority = {"none": 0, "weak": 1, "use_case": 2, "explicit": 3}
 
     for sentence in sentences:
-        sentence_lower = sentence.lower()
-        has_anchor = any(pattern.search(sentence_lower) for pattern in ANCHOR_PATTERNS)
-        if not has_anchor:
+        if not ANCHOR_RE.search(sentence):
             continue
+        sentence_lower = sentence.lower()
 
         explicit_hit = any(term in sentence_lower for term in EXPLICIT_TERMS)
         use_case_hit = any(term in sentence_lower for term in USE_CASE_TERMS)
@@ -429,11 +430,11 @@ def build_llm_context(text: str, max_chars: int) -> str:
     return context[:max_chars]
 
 
-def parse_company_name_from_full_submission(text: str) -> str | None:
-    match = re.search(r"^\s*COMPANY CONFORMED NAME:\s*(.+?)\s*$", text, flags=re.M)
+def parse_company_name_from_full_submission(raw: bytes) -> str | None:
+    match = COMPANY_NAME_RE.search(raw)
     if not match:
         return None
-    return normalize_company_name(match.group(1))
+    return normalize_company_name(match.group(1).decode("utf-8", errors="ignore"))
 
 
 def choose_backend(args: argparse.Namespace) -> LLMBackend | None:
@@ -554,8 +555,13 @@ def derive_bank_names(sec_zip: ZipFile, full_by_ticker: dict[str, dict[str, str]
             continue
         latest_period = max(period_map.keys(), key=period_key)
         member = period_map[latest_period]
-        raw_text = sec_zip.read(member).decode("utf-8", errors="ignore")
-        parsed = parse_company_name_from_full_submission(raw_text)
+        with sec_zip.open(member) as handle:
+            head = handle.read(FULL_SUBMISSION_HEADER_BYTES)
+        if len(head) == FULL_SUBMISSION_HEADER_BYTES:
+            head = head[: head.rfind(b"\n") + 1]
+        parsed = parse_company_name_from_full_submission(head)
+        if parsed is None and len(head) < sec_zip.getinfo(member).file_size:
+            parsed = parse_company_name_from_full_submission(sec_zip.read(member))
         if parsed:
             names[ticker] = parsed
         else:
@@ -797,14 +803,18 @@ def apply_percentile_normalization(rows: list[BankOutputRow]) -> None:
     n = len(sorted_scores)
 
     rank_map: dict[float, float] = {}
-    for score in sorted(set(sorted_scores)):
-        positions = [idx + 1 for idx, value in enumerate(sorted_scores) if value == score]
-        average_rank = statistics.fmean(positions)
+    start = 0
+    while start < n:
+        end = start
+        while end + 1 < n and sorted_scores[end + 1] == sorted_scores[start]:
+            end += 1
+        average_rank = (start + end) / 2.0 + 1.0
         if n == 1:
             percentile = 0.5
         else:
             percentile = (average_rank - 1.0) / (n - 1.0)
-        rank_map[score] = percentile
+        rank_map[sorted_scores[start]] = percentile
+        start = end + 1
 
     for row in rows:
         percentile = rank_map[row.AI_Score]
@@ -825,13 +835,14 @@ def write_csv(rows: list[BankOutputRow], output_path: Path) -> None:
 def write_xlsx(rows: list[BankOutputRow], output_path: Path) -> None:
     if not rows:
         return
+    from openpyxl import Workbook
+
     headers = list(asdict(rows[0]).keys())
-    workbook = Workbook()
-    sheet = workbook.active
-    sheet.title = "AI_Bank_Classification"
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(title="AI_Bank_Classification")
     sheet.append(headers)
     for row in rows:
-        sheet.append([asdict(row)[header] for header in headers])
+        sheet.append(list(asdict(row).values()))
     workbook.save(output_path)
 
 
@@ -877,8 +888,7 @@ def run_pipeline(
             tenk_scores: list[DocumentScore] = []
             for doc in k_docs:
                 doc.bank_name = bank_name
-                raw_html = sec_zip.read(doc.zip_member_path).decode("utf-8", errors="ignore")
-                cleaned = clean_10k_html(raw_html)
+                cleaned = clean_10k_html(sec_zip.read(doc.zip_member_path))
                 tenk_scores.append(score_document(doc, cleaned, backend, config, verbose))
 
             row = aggregate_bank(ticker, bank_name, transcript_scores, tenk_scores, config)
@@ -5,8 +5,24 @@ import re
 from pathlib import Path
 
 import pdfplumber
+from lxml import etree
+from lxml import html as lxml_html
 from pypdf import PdfReader
 
+BLOCK_TAGS = frozenset({"div", "p", "br", "tr", "li", "h1", "h2", "h3", "h4", "h5", "h6", "table", "section"})
+CELL_TAGS = frozenset({"td", "th"})
+DROPPED_SEC_NODES = etree.XPath(
+    "//script | //style"
+    " | //*[contains(translate(translate(@style, ' \t\r\n', ''),"
+    " 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'display:none')]"
+    " | //*[name()='ix:header' or name()='ix:hidden' or name()='ix:references' or name()='ix:resources']"
+    " | //*[starts-with(name(), 'xbrli:') or starts-with(name(), 'xbrldi:')"
+    " or starts-with(name(), 'link:') or starts-with(name(), 'xbrl:')]"
+)
+XML_DECLARATION_RE = re.compile(r"^\s*<\?xml[^>]*\?>", re.I)
+# huge_tree lifts libxml2's depth limit, which old EDGAR HTML built from unclosed <font> tags hits.
+SEC_HTML_PARSER = lxml_html.HTMLParser(remove_comments=True, remove_pis=True, encoding="utf-8", huge_tree=True)
+
 
 def normalize_whitespace(text: str) -> str:
     text = text.replace("\xa0", " ")
@@ -28,7 +44,39 @@ def clean_transcript_text(text: str) -> str:
     return normalize_whitespace("\n".join(lines))
 
 
-def clean_sec_html(text: str) -> str:
+def clean_sec_html(text: str | bytes) -> str:
+    if not text.strip():
+        return ""
+    # Bytes skip the Python-side decode; lxml only rejects an XML declaration on str input.
+    source = text if isinstance(text, bytes) else XML_DECLARATION_RE.sub("", text, count=1)
+    try:
+        root = lxml_html.fromstring(source, parser=SEC_HTML_PARSER)
+    except (etree.ParserError, ValueError):
+        return _clean_sec_html_regex(text)
+    # A fatal libxml2 error (e.g. a resource limit) truncates the tree without raising.
+    if any(error.level >= etree.ErrorLevels.FATAL for error in SEC_HTML_PARSER.error_log):
+        return _clean_sec_html_regex(text)
+
+    for element in DROPPED_SEC_NODES(root):
+        if element is root:
+            return ""
+        element.drop_tree()
+    for element in root.iter(*BLOCK_TAGS, *CELL_TAGS):
+        if element.tag in CELL_TAGS:
+            element.tail = " " + (element.tail or "")
+        else:
+            element.text = "\n" + (element.text or "")
+            element.tail = "\n" + (element.tail or "")
+    cleaned = root.text_content()
+    if isinstance(text, bytes):
+        cleaned = cleaned.replace("\ufffd", "")
+    cleaned = re.sub(r"\n\s+\n", "\n\n", cleaned)
+    return normalize_whitespace(cleaned)
+
+
+def _clean_sec_html_regex(text: str | bytes) -> str:
+    if isinstance(text, bytes):
+        text = text.decode("utf-8", errors="ignore")
     cleaned = text
     cleaned = re.sub(r"(?is)<(script|style)\b.*?>.*?</\1>", " ", cleaned)
     cleaned = re.sub(r"(?is)<[^>]*display\s*:\s*none[^>]*>.*?</[^>]+>", " ", cleaned)
@@ -69,7 +117,7 @@ def extract_text_from_file(path: Path) -> str:
     if suffix in {".txt", ".md", ".csv"}:
         return clean_plain_text(path.read_text(encoding="utf-8", errors="ignore"))
     if suffix in {".html", ".htm"}:
-        return clean_sec_html(path.read_text(encoding="utf-8", errors="ignore"))
+        return clean_sec_html(path.read_bytes())
     if suffix == ".pdf":
         return extract_text_from_pdf(path)
     return clean_plain_text(path.read_text(encoding="utf-8", errors="ignore"))
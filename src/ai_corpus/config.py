@@ -11,7 +11,7 @@ DEFAULT_ROSTER_CSV = ROOT_DIR / "AI_Bank_Classification.csv"
 DEFAULT_SEC_ZIP = ROOT_DIR / "10K_10Q_8K_DEF14A_combined_data.zip"
 DEFAULT_TRANSCRIPT_ZIP = ROOT_DIR / "transcripts_final-20260304T030232Z-1-001.zip"
 DEFAULT_AS_OF_DATE = date(2026, 3, 11)
-DEFAULT_TRANSCRIPT_PERIODS = [
+DEFAULT_TRANSCRIPT_PERIODS: tuple[tuple[int, int], ...] = (
     (2024, 1),
     (2024, 2),
     (2024, 3),
@@ -20,18 +20,23 @@ DEFAULT_TRANSCRIPT_PERIODS = [
     (2025, 2),
     (2025, 3),
     (2025, 4),
-]
-DEFAULT_CALL_REPORT_PERIODS = list(DEFAULT_TRANSCRIPT_PERIODS)
-DEFAULT_10K_PERIODS = [(2024, 4), (2025, 4)]
-DEFAULT_10Q_PERIODS = [
+)
+DEFAULT_CALL_REPORT_PERIODS = DEFAULT_TRANSCRIPT_PERIODS
+DEFAULT_10K_PERIODS: tuple[tuple[int, int], ...] = ((2024, 4), (2025, 4))
+DEFAULT_10Q_PERIODS: tuple[tuple[int, int], ...] = (
     (2024, 1),
     (2024, 2),
     (2024, 3),
     (2025, 1),
     (2025, 2),
     (2025, 3),
-]
-DEFAULT_PROXY_PERIODS = [(2024, 2), (2025, 2)]
+)
+DEFAULT_PROXY_PERIODS: tuple[tuple[int, int], ...] = ((2024, 2), (2025, 2))
+DEFAULT_SEC_FORM_PERIODS: dict[str, tuple[tuple[int, int], ...]] = {
+    "10-K": DEFAULT_10K_PERIODS,
+    "10-Q": DEFAULT_10Q_PERIODS,
+    "DEF 14A": DEFAULT_PROXY_PERIODS,
+}
 QWEN_MODEL_CANDIDATES = [
     "Qwen/Qwen2.5-7B-Instruct",
     "Qwen/Qwen2.5-3B-Instruct",
@@ -218,6 +223,10 @@ class CorpusPaths:
     def acquisition_log_csv(self) -> Path:
         return self.output_dir / "acquisition_log.csv"
 
+    @property
+    def download_failures_json(self) -> Path:
+        return self.cache_dir / "download_failures.json"
+
     @property
     def chunks_jsonl(self) -> Path:
         return self.output_dir / "chunks.jsonl"
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 import re
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 from zipfile import ZipFile
@@ -12,16 +16,13 @@ import chromadb
 import duckdb
 import matplotlib.pyplot as plt
 import pandas as pd
-import requests
 
 from .chunking import build_chunks
 from .cleaning import clean_sec_html, clean_transcript_text, extract_text_from_file, split_sections
 from .config import (
-    DEFAULT_10K_PERIODS,
-    DEFAULT_10Q_PERIODS,
     DEFAULT_AS_OF_DATE,
     DEFAULT_CALL_REPORT_PERIODS,
-    DEFAULT_PROXY_PERIODS,
+    DEFAULT_SEC_FORM_PERIODS,
     DEFAULT_TRANSCRIPT_PERIODS,
     CorpusPaths,
     STRUCTURED_METRIC_ALIASES,
@@ -43,7 +44,6 @@ from .public_sources import FdicClient, SecClient
 from .qwen import QwenAnswerGenerator
 from .themes import tag_themes
 from .utils import (
-    append_jsonl,
     ensure_dir,
     join_values,
     normalize_key,
@@ -58,27 +58,22 @@ from .utils import (
 
 TRANSCRIPT_RE = re.compile(r"^transcripts_final/([A-Z0-9]+)_(\d{4})_Q([1-4])\.txt$")
 SEC_HTML_RE = re.compile(
-    r"^data/sec-edgar-filings/([^/]+)/([^/]+)/([^/]+)/primary-document\.html$"
+    r"^data/sec-edgar-filings/([^/]+)/([^/]+)/((?:[^/]*?_(\d{4})_Q([1-4]))?[^/]*)/primary-document\.html$"
 )
 MANUAL_PERIOD_RE = re.compile(r"([A-Z0-9]+).*?(\d{4})_Q([1-4])", re.I)
 MANUAL_YEAR_ONLY_RE = re.compile(r"([A-Z0-9]+).*?(\d{4})", re.I)
 PROMPT_ARTIFACT = "compiled_prompt.json"
-AI_ANCHOR_PATTERNS = [
-    re.compile(r"\bartificial intelligence\b", re.I),
-    re.compile(r"\bmachine learning\b", re.I),
-    re.compile(r"\bgenerative ai\b", re.I),
-    re.compile(r"\bgenai\b", re.I),
-    re.compile(r"\blarge language model(s)?\b", re.I),
-    re.compile(r"\bllm(s)?\b", re.I),
-    re.compile(r"\bchatbot(s)?\b", re.I),
-    re.compile(r"\bcopilot(s)?\b", re.I),
-    re.compile(r"\bai\b", re.I),
-]
+PERMANENT_FAILURE_STATUS_CODES = frozenset({404, 410})
+AI_ANCHOR_RE = re.compile(
+    r"\b(?:artificial intelligence|machine learning|generative ai|genai|large language models?"
+    r"|llms?|chatbots?|copilots?|ai)\b",
+    re.I | re.ASCII,
+)
 
 
 def load_bank_roster(roster_csv: Path) -> list[BankRecord]:
-    frame = pd.read_csv(roster_csv)
     required = {"Ticker", "Bank"}
+    frame = pd.read_csv(roster_csv, usecols=lambda column: column in required)
     missing = required - set(frame.columns)
     if missing:
         raise RuntimeError(f"Roster CSV is missing required columns: {sorted(missing)}")
@@ -109,12 +104,27 @@ def ensure_corpus_dirs(paths: CorpusPaths) -> None:
 
 
 def has_ai_anchor(text: str) -> bool:
-    return any(pattern.search(text) for pattern in AI_ANCHOR_PATTERNS)
+    return AI_ANCHOR_RE.search(text) is not None
+
+
+@lru_cache(maxsize=8)
+def _open_archive(zip_path: Path, mtime_ns: int) -> ZipFile:
+    return ZipFile(zip_path)
+
+
+def _init_normalize_worker() -> None:
+    # Forked workers inherit the parent's cached ZipFile handles, whose shared file offset makes
+    # concurrent reads race; each worker opens its own instead.
+    _open_archive.cache_clear()
+
+
+def _read_zip_member_bytes(zip_path: Path, member_path: str) -> bytes:
+    archive = _open_archive(zip_path, zip_path.stat().st_mtime_ns)
+    return archive.read(member_path)
 
 
 def _read_zip_member(zip_path: Path, member_path: str) -> str:
-    with ZipFile(zip_path) as archive:
-        return archive.read(member_path).decode("utf-8", errors="ignore")
+    return _read_zip_member_bytes(zip_path, member_path).decode("utf-8", errors="ignore")
 
 
 def _make_zip_ref(zip_path: Path, member_path: str) -> str:
@@ -165,20 +175,18 @@ def discover_sec_documents(paths: CorpusPaths, roster_map: dict[str, str]) -> li
             match = SEC_HTML_RE.match(member)
             if not match:
                 continue
-            ticker, form_type, folder = match.groups()
-            period_match = re.search(r"_(\d{4})_Q([1-4])", folder)
-            year = int(period_match.group(1)) if period_match else None
-            quarter = int(period_match.group(2)) if period_match else None
+            ticker, form_type, folder, year, quarter = match.groups()
             doc_id = f"{ticker}_{slugify(form_type)}_{folder}"
+            ticker = ticker.upper()
             docs.append(
                 DiscoveredDocument(
                     doc_id=doc_id,
-                    ticker=ticker.upper(),
-                    bank_name=roster_map.get(ticker.upper(), ticker.upper()),
+                    ticker=ticker,
+                    bank_name=roster_map.get(ticker, ticker),
                     source_type="sec_filing",
                     form_type=form_type,
-                    period_year=year,
-                    period_quarter=quarter,
+                    period_year=int(year) if year else None,
+                    period_quarter=int(quarter) if quarter else None,
                     filing_or_issue_date="",
                     storage_kind="zip_member",
                     source_path_or_url=_make_zip_ref(paths.sec_zip, member),
@@ -208,13 +216,30 @@ def _infer_manual_metadata(path: Path, roster_map: dict[str, str]) -> tuple[str,
     return "UNKNOWN", None, None
 
 
+def _iter_files(root: Path) -> list[Path]:
+    files: list[str] = []
+    pending = [str(root)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif (
+                    entry.is_file()
+                    and not entry.name.startswith(".")
+                    and not entry.name.endswith(".part")
+                    and entry.stat().st_size > 0
+                ):
+                    files.append(entry.path)
+    files.sort()
+    return [Path(path) for path in files]
+
+
 def discover_manual_documents(paths: CorpusPaths, roster_map: dict[str, str]) -> list[DiscoveredDocument]:
     docs: list[DiscoveredDocument] = []
     if not paths.manual_source_dir.exists():
         return docs
-    for path in sorted(paths.manual_source_dir.rglob("*")):
-        if not path.is_file() or path.name.startswith("."):
-            continue
+    for path in _iter_files(paths.manual_source_dir):
         if path.suffix.lower() in {".json", ".parquet"} and path.parent.name == "call_reports":
             content_type = "application/json" if path.suffix.lower() == ".json" else "application/parquet"
         else:
@@ -433,6 +458,8 @@ def build_manifest(
     paths: CorpusPaths | None = None,
     as_of: date = DEFAULT_AS_OF_DATE,
     refresh_public_catalog: bool = True,
+    sec_client: SecClient | None = None,
+    fdic_client: FdicClient | None = None,
 ) -> list[ManifestRow]:
     paths = paths or CorpusPaths()
     ensure_corpus_dirs(paths)
@@ -443,9 +470,21 @@ def build_manifest(
     manual_docs = discover_manual_documents(paths, roster_map)
     all_docs = transcript_docs + sec_docs + manual_docs
     grouped = _group_docs(all_docs)
-
-    sec_client = SecClient() if refresh_public_catalog else None
-    fdic_client = FdicClient() if refresh_public_catalog else None
+    mra_docs_by_ticker: dict[str, list[DiscoveredDocument]] = defaultdict(list)
+    for doc in manual_docs:
+        if doc.source_type == "mra_mria":
+            mra_docs_by_ticker[doc.ticker].append(doc)
+    eight_k_docs_by_ticker: dict[str, list[DiscoveredDocument]] = defaultdict(list)
+    for doc in sec_docs:
+        if doc.form_type == "8-K":
+            eight_k_docs_by_ticker[doc.ticker].append(doc)
+
+    if refresh_public_catalog:
+        sec_client = sec_client or SecClient(cache_dir=paths.cache_dir)
+        fdic_client = fdic_client or FdicClient()
+    else:
+        sec_client = None
+        fdic_client = None
     rows: list[ManifestRow] = []
 
     for bank in roster:
@@ -473,11 +512,18 @@ def build_manifest(
             )
 
         fdic_match = fdic_client.match_bank(bank.ticker, bank.bank_name) if fdic_client else None
-        call_report_docs = [doc for doc in manual_docs if doc.source_type == "call_report" and doc.ticker == bank.ticker]
-        call_group = _group_docs(call_report_docs)
-        call_rows = fdic_client.find_call_report_rows(fdic_match.cert, DEFAULT_CALL_REPORT_PERIODS) if fdic_match else {}
+        needed_call_periods = tuple(
+            period
+            for period in DEFAULT_CALL_REPORT_PERIODS
+            if not grouped.get((bank.ticker, "call_report", "call_report", *period))
+        )
+        call_rows = (
+            fdic_client.find_call_report_rows(fdic_match.cert, needed_call_periods)
+            if fdic_match and needed_call_periods
+            else {}
+        )
         for year, quarter in DEFAULT_CALL_REPORT_PERIODS:
-            docs = call_group.get((bank.ticker, "call_report", "call_report", year, quarter), [])
+            docs = grouped.get((bank.ticker, "call_report", "call_report", year, quarter), [])
             row_status = "manual_review_required"
             status_detail = "FDIC institution match unavailable"
             source_url = ""
@@ -550,18 +596,12 @@ def build_manifest(
                     )
                 )
 
-        fixed_expectations = {
-            "10-K": DEFAULT_10K_PERIODS,
-            "10-Q": DEFAULT_10Q_PERIODS,
-            "DEF 14A": DEFAULT_PROXY_PERIODS,
-        }
-        for form_type, periods in fixed_expectations.items():
-            local_group = grouped
+        for form_type, periods in DEFAULT_SEC_FORM_PERIODS.items():
             filings_by_period: dict[tuple[int, int], list[Any]] = defaultdict(list)
             for filing in sec_official_by_form.get(form_type, []):
                 filings_by_period[(filing.period_year, filing.period_quarter)].append(filing)
             for year, quarter in periods:
-                docs = local_group.get((bank.ticker, "sec_filing", form_type, year, quarter), [])
+                docs = grouped.get((bank.ticker, "sec_filing", form_type, year, quarter), [])
                 official_filings = filings_by_period.get((year, quarter), [])
                 expected_count = len(official_filings) if sec_client and official_filings else 1
                 status = "available" if len(docs) >= expected_count and expected_count > 0 else "missing"
@@ -595,11 +635,7 @@ def build_manifest(
         for filing in sec_official_by_form.get("8-K", []):
             eight_k_filings[(filing.period_year, filing.period_quarter)].append(filing)
         if not eight_k_filings:
-            eight_k_local = [
-                doc for doc in sec_docs
-                if doc.ticker == bank.ticker and doc.form_type == "8-K"
-            ]
-            for doc in eight_k_local:
+            for doc in eight_k_docs_by_ticker.get(bank.ticker, []):
                 eight_k_filings[(doc.period_year or 0, doc.period_quarter or 0)].append(doc)
         for (year, quarter), filings in sorted(eight_k_filings.items()):
             docs = grouped.get((bank.ticker, "sec_filing", "8-K", year, quarter), [])
@@ -626,7 +662,7 @@ def build_manifest(
                 )
             )
 
-        mra_docs = [doc for doc in manual_docs if doc.source_type == "mra_mria" and doc.ticker == bank.ticker]
+        mra_docs = mra_docs_by_ticker.get(bank.ticker, [])
         rows.append(
             ManifestRow(
                 ticker=bank.ticker,
@@ -659,11 +695,38 @@ def acquire_missing(
 ) -> list[AcquisitionLogRow]:
     paths = paths or CorpusPaths()
     ensure_corpus_dirs(paths)
+    sec_client = SecClient(cache_dir=paths.cache_dir)
+    fdic_client = FdicClient()
     if not paths.manifest_csv.exists():
-        build_manifest(paths=paths, as_of=as_of)
+        build_manifest(paths=paths, as_of=as_of, sec_client=sec_client, fdic_client=fdic_client)
     frame = pd.read_csv(paths.manifest_csv)
     logs: list[AcquisitionLogRow] = []
 
+    download_failures = _load_download_failures(paths.download_failures_json)
+    sec_targets = [
+        (url, target)
+        for row in frame.itertuples(index=False)
+        if row.source_type == "sec_filing" and str(row.status) in {"missing", "partial"}
+        for url, target in _sec_download_targets(paths, row)
+        if not target.exists() and url not in download_failures
+    ]
+    sec_outcomes = sec_client.download_documents(sec_targets)
+    for url, target in sec_targets:
+        status_code = _http_status_code(sec_outcomes.get(target))
+        if status_code in PERMANENT_FAILURE_STATUS_CODES:
+            download_failures[url] = f"HTTP {status_code} at {now_utc_iso()}"
+    if download_failures:
+        write_json(download_failures, paths.download_failures_json)
+    call_report_payloads = fdic_client.fetch_json_many(
+        [
+            url
+            for row in frame.itertuples(index=False)
+            if row.source_type == "call_report" and str(row.status) in {"missing", "partial"}
+            for url in _split_source_urls(row.source_urls)[:1]
+            if url.startswith("http")
+        ]
+    )
+
     for row in frame.itertuples(index=False):
         if str(row.status) not in {"missing", "partial"}:
             if row.source_type == "mra_mria":
@@ -684,7 +747,7 @@ def acquire_missing(
                 )
             continue
 
-        source_urls = [value.strip() for value in str(row.source_urls).split("|") if value.strip()]
+        source_urls = _split_source_urls(row.source_urls)
         saved_path = ""
         outcome = "not_attempted"
         notes = ""
@@ -692,15 +755,19 @@ def acquire_missing(
         attempt_type = "network_download"
 
         if row.source_type == "call_report" and query_or_url.startswith("http"):
-            response = requests.get(query_or_url, timeout=60)
-            payload = response.json()
+            payload = call_report_payloads[query_or_url]
             period_repdte = quarter_end_date(int(row.period_year), int(row.period_quarter))
-            matched = [
-                item.get("data", {})
-                for item in payload.get("data", [])
-                if str(item.get("data", {}).get("REPDTE", "")) == period_repdte
-            ]
-            if matched:
+            matched = []
+            if not isinstance(payload, Exception):
+                matched = [
+                    item.get("data", {})
+                    for item in payload.get("data", [])
+                    if str(item.get("data", {}).get("REPDTE", "")) == period_repdte
+                ]
+            if isinstance(payload, Exception):
+                outcome = "not_found"
+                notes = str(payload)
+            elif matched:
                 target = (
                     paths.manual_source_dir
                     / "call_reports"
@@ -715,27 +782,14 @@ def acquire_missing(
 
         elif row.source_type == "sec_filing" and source_urls:
             downloaded_paths = []
-            for url in source_urls:
-                try:
-                    response = requests.get(
-                        url,
-                        timeout=60,
-                        headers={"User-Agent": "BUFN403 Capstone omtailor@example.com"},
-                    )
-                    if response.status_code >= 400:
-                        continue
-                    suffix = Path(url).suffix or ".html"
-                    target = (
-                        paths.manual_source_dir
-                        / "sec"
-                        / row.form_type
-                        / f"{row.ticker}_{slugify(row.form_type)}_{row.period_label}{suffix}"
-                    )
-                    ensure_dir(target.parent)
-                    target.write_text(response.text, encoding="utf-8")
+            for url, target in _sec_download_targets(paths, row):
+                error = sec_outcomes.get(target)
+                if error is not None:
+                    notes = str(error)
+                elif url in download_failures and not target.exists():
+                    notes = f"Skipped known failure: {download_failures[url]}"
+                elif target.exists():
                     downloaded_paths.append(str(target))
-                except Exception as exc:  # noqa: BLE001
-                    notes = str(exc)
             if downloaded_paths:
                 saved_path = join_values(downloaded_paths)
                 outcome = "downloaded"
@@ -764,10 +818,41 @@ def acquire_missing(
         )
 
     write_csv([log.as_dict() for log in logs], paths.acquisition_log_csv)
-    build_manifest(paths=paths, as_of=as_of)
+    build_manifest(paths=paths, as_of=as_of, sec_client=sec_client, fdic_client=fdic_client)
     return logs
 
 
+def _load_download_failures(path: Path) -> dict[str, str]:
+    if not path.exists():
+        return {}
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return {str(url): str(reason) for url, reason in payload.items()} if isinstance(payload, dict) else {}
+
+
+def _http_status_code(error: Exception | None) -> int | None:
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None)
+
+
+def _split_source_urls(value: Any) -> list[str]:
+    return [item.strip() for item in str(value).split("|") if item.strip()]
+
+
+def _sec_download_targets(paths: CorpusPaths, row: Any) -> list[tuple[str, Path]]:
+    source_urls = _split_source_urls(row.source_urls)
+    targets: list[tuple[str, Path]] = []
+    for url in source_urls:
+        stem = f"{row.ticker}_{slugify(row.form_type)}_{row.period_label}"
+        if len(source_urls) > 1:
+            stem = f"{stem}_{Path(url).parent.name}"
+        suffix = Path(url).suffix or ".html"
+        targets.append((url, paths.manual_source_dir / "sec" / row.form_type / f"{stem}{suffix}"))
+    return targets
+
+
 def _read_discovered_document(doc: DiscoveredDocument) -> str:
     if doc.storage_kind == "zip_member":
         zip_path, member = _split_zip_ref(doc.local_path)
@@ -795,9 +880,29 @@ def _normalize_call_report_frame(path: Path, ticker: str, bank_name: str) -> pd.
     return frame
 
 
+def _prepare_narrative_sections(doc: DiscoveredDocument) -> tuple[str, list[tuple[str, str]]]:
+    if doc.storage_kind == "zip_member" and doc.source_type == "sec_filing":
+        raw_text: str | bytes = _read_zip_member_bytes(*_split_zip_ref(doc.local_path))
+    elif doc.storage_kind == "zip_member":
+        raw_text = _read_discovered_document(doc)
+    else:
+        raw_text = extract_text_from_file(Path(doc.local_path))
+    if doc.source_type == "transcript":
+        cleaned_text = clean_transcript_text(raw_text)
+    elif doc.source_type == "sec_filing":
+        cleaned_text = clean_sec_html(raw_text)
+    else:
+        cleaned_text = raw_text
+    if not cleaned_text.strip():
+        return "", []
+    digest = hashlib.blake2b(cleaned_text.encode("utf-8"), digest_size=16).hexdigest()
+    return digest, split_sections(cleaned_text, doc.source_type)
+
+
 def normalize_corpus(
     *,
     paths: CorpusPaths | None = None,
+    max_workers: int | None = None,
 ) -> dict[str, Any]:
     paths = paths or CorpusPaths()
     ensure_corpus_dirs(paths)
@@ -814,47 +919,57 @@ def normalize_corpus(
     ]
     call_report_docs = [doc for doc in manual_docs if doc.source_type == "call_report"]
 
-    paths.chunks_jsonl.write_text("", encoding="utf-8")
     structured_frames: list[pd.DataFrame] = []
     normalized_count = 0
     chunk_count = 0
+    duplicate_count = 0
+    seen_digests: set[tuple[str, str]] = set()
 
-    for doc in narrative_docs:
-        if doc.storage_kind == "zip_member":
-            raw_text = _read_discovered_document(doc)
-        else:
-            raw_text = extract_text_from_file(Path(doc.local_path))
-        if doc.source_type == "transcript":
-            cleaned_text = clean_transcript_text(raw_text)
-        elif doc.source_type == "sec_filing":
-            cleaned_text = clean_sec_html(raw_text)
+    executor = (
+        ProcessPoolExecutor(max_workers=max_workers, initializer=_init_normalize_worker)
+        if max_workers != 1
+        else None
+    )
+    try:
+        if executor is not None:
+            prepared = executor.map(_prepare_narrative_sections, narrative_docs, chunksize=8)
         else:
-            cleaned_text = raw_text
-        if not cleaned_text.strip():
-            continue
-        sections = split_sections(cleaned_text, doc.source_type)
-        for section_index, (section_title, section_text) in enumerate(sections):
-            normalized = NormalizedDocument(
-                doc_id=f"{doc.doc_id}__sec_{section_index:03d}",
-                ticker=doc.ticker,
-                bank_name=doc.bank_name,
-                source_type=doc.source_type,
-                form_type=doc.form_type,
-                period_year=doc.period_year,
-                period_quarter=doc.period_quarter,
-                filing_or_issue_date=doc.filing_or_issue_date,
-                section_title=section_title,
-                source_path_or_url=doc.source_path_or_url,
-                storage_kind=doc.storage_kind,
-                cleaned_text=section_text,
-                theme_tags=tag_themes(section_text),
-                metadata=doc.metadata | {"parent_doc_id": doc.doc_id},
-            )
-            write_json(normalized.as_dict(), normalized.output_path(paths.documents_dir))
-            chunks = build_chunks(normalized)
-            append_jsonl([chunk.as_dict() for chunk in chunks], paths.chunks_jsonl)
-            normalized_count += 1
-            chunk_count += len(chunks)
+            prepared = map(_prepare_narrative_sections, narrative_docs)
+        with paths.chunks_jsonl.open("w", encoding="utf-8") as chunks_file:
+            for doc, (digest, sections) in zip(narrative_docs, prepared):
+                if (doc.ticker, digest) in seen_digests:
+                    duplicate_count += 1
+                    continue
+                if digest:
+                    seen_digests.add((doc.ticker, digest))
+                for section_index, (section_title, section_text) in enumerate(sections):
+                    normalized = NormalizedDocument(
+                        doc_id=f"{doc.doc_id}__sec_{section_index:03d}",
+                        ticker=doc.ticker,
+                        bank_name=doc.bank_name,
+                        source_type=doc.source_type,
+                        form_type=doc.form_type,
+                        period_year=doc.period_year,
+                        period_quarter=doc.period_quarter,
+                        filing_or_issue_date=doc.filing_or_issue_date,
+                        section_title=section_title,
+                        source_path_or_url=doc.source_path_or_url,
+                        storage_kind=doc.storage_kind,
+                        cleaned_text=section_text,
+                        theme_tags=tag_themes(section_text),
+                        metadata=doc.metadata | {"parent_doc_id": doc.doc_id},
+                    )
+                    normalized.output_path(paths.documents_dir).write_bytes(
+                        json.dumps(normalized.as_dict(), indent=2, sort_keys=True).encode("utf-8")
+                    )
+                    chunks = build_chunks(normalized)
+                    for chunk in chunks:
+                        chunks_file.write(json.dumps(chunk.as_dict(), sort_keys=True) + "\n")
+                    normalized_count += 1
+                    chunk_count += len(chunks)
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
     for doc in call_report_docs:
         frame = _normalize_call_report_frame(Path(doc.local_path), doc.ticker, doc.bank_name)
@@ -870,6 +985,7 @@ def normalize_corpus(
 
     summary = {
         "normalized_documents": normalized_count,
+        "duplicate_documents": duplicate_count,
         "chunk_count": chunk_count,
         "call_report_rows": call_report_rows,
         "documents_dir": str(paths.documents_dir),
@@ -879,11 +995,48 @@ def normalize_corpus(
     return summary
 
 
+def _chunk_index_metadata(row: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "doc_id": row["doc_id"],
+        "ticker": row["ticker"],
+        "bank_name": row["bank_name"],
+        "source_type": row["source_type"],
+        "form_type": row["form_type"],
+        "period_year": int(row["period_year"]) if row["period_year"] is not None else -1,
+        "period_quarter": int(row["period_quarter"]) if row["period_quarter"] is not None else -1,
+        "filing_or_issue_date": row["filing_or_issue_date"] or "",
+        "section_title": row["section_title"],
+        "source_path_or_url": row["source_path_or_url"],
+        "quality_flags": row["quality_flags"],
+        "theme_tags": row["theme_tags"],
+        "content_hash": row["content_hash"],
+    }
+
+
+def _load_reusable_index(
+    client: Any,
+    collection_name: str,
+    embedding_name: str,
+) -> tuple[Any, dict[str, dict[str, Any]]] | None:
+    try:
+        collection = client.get_collection(collection_name)
+    except Exception:
+        return None
+    if (collection.metadata or {}).get("embedding_model") != embedding_name:
+        return None
+    existing = collection.get(include=["metadatas"])
+    indexed = {chunk_id: metadata or {} for chunk_id, metadata in zip(existing["ids"], existing["metadatas"])}
+    if any("content_hash" not in metadata for metadata in indexed.values()):
+        return None
+    return collection, indexed
+
+
 def build_index(
     *,
     paths: CorpusPaths | None = None,
     embedding_model: str | None = None,
     collection_name: str = "ai_usage_corpus",
+    rebuild: bool = False,
 ) -> dict[str, Any]:
     paths = paths or CorpusPaths()
     ensure_corpus_dirs(paths)
@@ -897,38 +1050,36 @@ def build_index(
     ]
     chunk_rows = [row for row in chunk_rows if has_ai_anchor(row["chunk_text"])]
     embedder = build_embedder(embedding_model)
+    embedding_name = getattr(embedder, "model_name", "hash")
     client = chromadb.PersistentClient(path=str(paths.index_dir))
-    try:
-        client.delete_collection(collection_name)
-    except Exception:
-        pass
-    collection = client.create_collection(name=collection_name, metadata={"hnsw:space": "cosine"})
+    metadata_by_id = {row["chunk_id"]: _chunk_index_metadata(row) for row in chunk_rows}
+    reusable = None if rebuild else _load_reusable_index(client, collection_name, embedding_name)
+    if reusable is None:
+        try:
+            client.delete_collection(collection_name)
+        except Exception:
+            pass
+        collection = client.create_collection(
+            name=collection_name,
+            metadata={"hnsw:space": "cosine", "embedding_model": embedding_name},
+        )
+        pending_rows = chunk_rows
+    else:
+        collection, indexed = reusable
+        stale_ids = [chunk_id for chunk_id, metadata in indexed.items() if metadata_by_id.get(chunk_id) != metadata]
+        for start in range(0, len(stale_ids), 1000):
+            collection.delete(ids=stale_ids[start : start + 1000])
+        pending_rows = [row for row in chunk_rows if indexed.get(row["chunk_id"]) != metadata_by_id[row["chunk_id"]]]
+
     batch_size = 64
-    for start in range(0, len(chunk_rows), batch_size):
-        batch = chunk_rows[start : start + batch_size]
+    for start in range(0, len(pending_rows), batch_size):
+        batch = pending_rows[start : start + batch_size]
         embeddings = embedder.encode([row["chunk_text"] for row in batch])
-        metadatas = []
-        for row in batch:
-            metadata = {
-                "doc_id": row["doc_id"],
-                "ticker": row["ticker"],
-                "bank_name": row["bank_name"],
-                "source_type": row["source_type"],
-                "form_type": row["form_type"],
-                "period_year": int(row["period_year"]) if row["period_year"] is not None else -1,
-                "period_quarter": int(row["period_quarter"]) if row["period_quarter"] is not None else -1,
-                "filing_or_issue_date": row["filing_or_issue_date"] or "",
-                "section_title": row["section_title"],
-                "source_path_or_url": row["source_path_or_url"],
-                "quality_flags": row["quality_flags"],
-                "theme_tags": row["theme_tags"],
-            }
-            metadatas.append(metadata)
         collection.add(
             ids=[row["chunk_id"] for row in batch],
             embeddings=embeddings,
             documents=[row["chunk_text"] for row in batch],
-            metadatas=metadatas,
+            metadatas=[metadata_by_id[row["chunk_id"]] for row in batch],
         )
 
     con = duckdb.connect(str(paths.corpus_db))
@@ -940,7 +1091,8 @@ def build_index(
     summary = {
         "collection_name": collection_name,
         "chunk_count": len(chunk_rows),
-        "embedding_model": getattr(embedder, "model_name", "hash"),
+        "embedded_chunk_count": len(pending_rows),
+        "embedding_model": embedding_name,
         "index_dir": str(paths.index_dir),
         "corpus_db": str(paths.corpus_db),
     }
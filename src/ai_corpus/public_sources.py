@@ -1,20 +1,48 @@
 from __future__ import annotations
 
 import difflib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, datetime, timezone
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .config import CALL_REPORT_FIELDS, DEFAULT_AS_OF_DATE
-from .utils import normalize_key, quarter_end_date
+from .utils import ensure_dir, normalize_key, quarter_end_date
 
 SEC_TICKERS_URL = "https://www.sec.gov/files/company_tickers.json"
 SEC_SUBMISSIONS_URL = "https://data.sec.gov/submissions/CIK{cik}.json"
 SEC_ARCHIVE_URL = "https://www.sec.gov/Archives/edgar/data/{cik_no_zero}/{accession_compact}/{primary_document}"
 FDIC_INSTITUTIONS_URL = "https://api.fdic.gov/banks/institutions"
 FDIC_FINANCIALS_URL = "https://api.fdic.gov/banks/financials"
+SEC_MAX_REQUESTS_PER_SECOND = 10
+RETRYABLE_STATUS_CODES = frozenset({429, 503})
+RETRY_MAX_ATTEMPTS = 5
+RETRY_MIN_DELAY_SECONDS = 0.5
+RETRY_MAX_DELAY_SECONDS = 8.0
+RETRY_AFTER_MAX_SECONDS = 60.0
+SEC_CACHE_TTL_SECONDS = 24 * 60 * 60
+FDIC_MAX_REQUESTS_PER_SECOND = 10
+FDIC_FETCH_WORKERS = 4
+DOWNLOAD_CHUNK_BYTES = 1 << 20
+HTTP_POOL_MAXSIZE = 16
+TRANSIENT_RETRY = Retry(
+    total=3,
+    backoff_factor=1.0,
+    status_forcelist=(500, 502, 504),
+    allowed_methods=frozenset({"GET"}),
+    raise_on_status=False,
+    respect_retry_after_header=False,
+)
 
 
 @dataclass(slots=True)
@@ -42,17 +70,152 @@ class FdicInstitutionMatch:
     confidence: float
 
 
+def build_session(*, pool_maxsize: int = HTTP_POOL_MAXSIZE) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=pool_maxsize, max_retries=TRANSIENT_RETRY)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class RateLimiter:
+    def __init__(self, max_calls_per_second: float) -> None:
+        self.min_interval = 1.0 / max_calls_per_second
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            slot = max(time.monotonic(), self._next_slot)
+            self._next_slot = slot + self.min_interval
+        delay = slot - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
+def retry_delay_seconds(response: requests.Response, attempt: int) -> float | None:
+    backoff = min(RETRY_MIN_DELAY_SECONDS * (2 ** (attempt - 1)), RETRY_MAX_DELAY_SECONDS)
+    retry_after = str(response.headers.get("Retry-After", "")).strip()
+    if not retry_after:
+        return backoff
+    try:
+        delay = float(retry_after)
+    except ValueError:
+        try:
+            delay = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return backoff
+    if delay > RETRY_AFTER_MAX_SECONDS:
+        return None
+    return max(delay, 0.0)
+
+
+def _publish_no_clobber(partial: Path, target: Path) -> None:
+    # A hard link is an atomic create-if-absent; filesystems without hard links fall back to a replace.
+    try:
+        os.link(partial, target)
+    except FileExistsError:
+        pass
+    except OSError:
+        partial.replace(target)
+        return
+    partial.unlink()
+
+
+def _read_json_file(path: Path) -> Any | None:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json_atomic(payload: Any, path: Path) -> None:
+    temporary = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        temporary.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(temporary, path)
+    finally:
+        temporary.unlink(missing_ok=True)
+
+
 class SecClient:
-    def __init__(self, user_agent: str = "BUFN403 Capstone omtailor@example.com") -> None:
-        self.session = requests.Session()
+    def __init__(
+        self,
+        user_agent: str = "BUFN403 Capstone omtailor@example.com",
+        *,
+        max_requests_per_second: float = SEC_MAX_REQUESTS_PER_SECOND,
+        cache_dir: Path | None = None,
+        cache_ttl_seconds: float = SEC_CACHE_TTL_SECONDS,
+    ) -> None:
+        self.session = build_session()
         self.session.headers.update({"User-Agent": user_agent})
+        self.limiter = RateLimiter(max_requests_per_second)
+        self.cache_dir = cache_dir
+        self.cache_ttl_seconds = cache_ttl_seconds
         self._ticker_map: dict[str, str] | None = None
+        self._submissions: dict[str, dict[str, Any]] = {}
+
+    def _get(
+        self,
+        url: str,
+        *,
+        timeout: int = 30,
+        stream: bool = False,
+        headers: dict[str, str] | None = None,
+    ) -> requests.Response:
+        for attempt in range(1, RETRY_MAX_ATTEMPTS + 1):
+            self.limiter.wait()
+            response = self.session.get(url, timeout=timeout, stream=stream, headers=headers)
+            if response.status_code not in RETRYABLE_STATUS_CODES or attempt == RETRY_MAX_ATTEMPTS:
+                return response
+            delay = retry_delay_seconds(response, attempt)
+            if delay is None:
+                return response
+            response.close()
+            time.sleep(delay)
+        return response
+
+    def _get_json(self, url: str, cache_name: str) -> Any:
+        cache_path = self.cache_dir / "sec" / cache_name if self.cache_dir else None
+        if not cache_path:
+            response = self._get(url)
+            response.raise_for_status()
+            return response.json()
+        validators_path = cache_path.with_name(f"{cache_path.name}.etag")
+        headers: dict[str, str] = {}
+        cached = _read_json_file(cache_path)
+        if cached is not None:
+            cached_mtime = cache_path.stat().st_mtime
+            if time.time() - cached_mtime < self.cache_ttl_seconds:
+                return cached
+            validators = _read_json_file(validators_path)
+            if not isinstance(validators, dict):
+                validators = {}
+            if validators.get("etag"):
+                headers["If-None-Match"] = str(validators["etag"])
+            headers["If-Modified-Since"] = str(validators.get("last_modified") or formatdate(cached_mtime, usegmt=True))
+        response = self._get(url, headers=headers or None)
+        if headers and response.status_code == 304:
+            response.close()
+            os.utime(cache_path)
+            return cached
+        response.raise_for_status()
+        payload = response.json()
+        ensure_dir(cache_path.parent)
+        _write_json_atomic(payload, cache_path)
+        validators = {
+            "etag": response.headers.get("ETag", ""),
+            "last_modified": response.headers.get("Last-Modified", ""),
+        }
+        if any(validators.values()):
+            _write_json_atomic(validators, validators_path)
+        else:
+            validators_path.unlink(missing_ok=True)
+        return payload
 
     def ticker_map(self) -> dict[str, str]:
         if self._ticker_map is None:
-            response = self.session.get(SEC_TICKERS_URL, timeout=30)
-            response.raise_for_status()
-            payload = response.json()
+            payload = self._get_json(SEC_TICKERS_URL, "company_tickers.json")
             self._ticker_map = {
                 row["ticker"].upper(): f"{int(row['cik_str']):010d}"
                 for row in payload.values()
@@ -73,9 +236,9 @@ class SecClient:
         cik = self.cik_for_ticker(ticker)
         if not cik:
             return []
-        response = self.session.get(SEC_SUBMISSIONS_URL.format(cik=cik), timeout=30)
-        response.raise_for_status()
-        payload = response.json()
+        if cik not in self._submissions:
+            self._submissions[cik] = self._get_json(SEC_SUBMISSIONS_URL.format(cik=cik), f"submissions_CIK{cik}.json")
+        payload = self._submissions[cik]
         recent = payload.get("filings", {}).get("recent", {})
         result: list[SecFilingRecord] = []
         total = len(recent.get("form", []))
@@ -110,11 +273,43 @@ class SecClient:
             )
         return result
 
+    def download_documents(
+        self,
+        targets: list[tuple[str, Path]],
+        *,
+        max_workers: int = SEC_MAX_REQUESTS_PER_SECOND,
+    ) -> dict[Path, Exception | None]:
+        unique_targets = list(dict.fromkeys(targets))
+        if not unique_targets:
+            return {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            outcomes = executor.map(lambda item: self._download_document(*item), unique_targets)
+            return {target: outcome for (_, target), outcome in zip(unique_targets, outcomes)}
+
+    def _download_document(self, url: str, target: Path) -> Exception | None:
+        partial = target.with_name(f"{target.name}.part")
+        try:
+            with self._get(url, timeout=60, stream=True) as response:
+                response.raise_for_status()
+                ensure_dir(target.parent)
+                with partial.open("wb") as outfile:
+                    for block in response.iter_content(chunk_size=DOWNLOAD_CHUNK_BYTES):
+                        outfile.write(block)
+            _publish_no_clobber(partial, target)
+        except Exception as exc:  # noqa: BLE001
+            return exc
+        finally:
+            partial.unlink(missing_ok=True)
+        return None
+
 
 class FdicClient:
-    def __init__(self) -> None:
-        self.session = requests.Session()
+    def __init__(self, *, max_requests_per_second: float = FDIC_MAX_REQUESTS_PER_SECOND) -> None:
+        self.session = build_session()
+        self.limiter = RateLimiter(max_requests_per_second)
         self._institutions: list[dict[str, Any]] | None = None
+        self._matches: dict[tuple[str, str], FdicInstitutionMatch | None] = {}
+        self._call_reports: dict[int, list[dict[str, Any]]] = {}
 
     def list_institutions(self) -> list[dict[str, Any]]:
         if self._institutions is not None:
@@ -145,7 +340,34 @@ class FdicClient:
         self._institutions = rows
         return rows
 
+    def fetch_json_many(
+        self,
+        urls: list[str],
+        *,
+        max_workers: int = FDIC_FETCH_WORKERS,
+    ) -> dict[str, dict[str, Any] | Exception]:
+        unique_urls = list(dict.fromkeys(urls))
+        if not unique_urls:
+            return {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(unique_urls, executor.map(self._fetch_json, unique_urls)))
+
+    def _fetch_json(self, url: str) -> dict[str, Any] | Exception:
+        self.limiter.wait()
+        try:
+            response = self.session.get(url, timeout=60)
+            response.raise_for_status()
+            return response.json()
+        except Exception as exc:  # noqa: BLE001
+            return exc
+
     def match_bank(self, ticker: str, bank_name: str) -> FdicInstitutionMatch | None:
+        key = (ticker.upper(), bank_name)
+        if key not in self._matches:
+            self._matches[key] = self._match_bank(ticker, bank_name)
+        return self._matches[key]
+
+    def _match_bank(self, ticker: str, bank_name: str) -> FdicInstitutionMatch | None:
         wanted = normalize_key(bank_name.replace("corp", "").replace("corporation", ""))
         best_row: dict[str, Any] | None = None
         best_score = 0.0
@@ -175,6 +397,8 @@ class FdicClient:
         )
 
     def list_call_reports(self, cert: int) -> list[dict[str, Any]]:
+        if cert in self._call_reports:
+            return self._call_reports[cert]
         response = self.session.get(
             FDIC_FINANCIALS_URL,
             params={
@@ -189,13 +413,26 @@ class FdicClient:
         )
         response.raise_for_status()
         payload = response.json()
-        return [item.get("data", {}) for item in payload.get("data", []) if isinstance(item, dict)]
+        rows = [item.get("data", {}) for item in payload.get("data", []) if isinstance(item, dict)]
+        self._call_reports[cert] = rows
+        return rows
 
-    def find_call_report_rows(self, cert: int, periods: list[tuple[int, int]]) -> dict[tuple[int, int], dict[str, Any]]:
+    def find_call_report_rows(
+        self,
+        cert: int,
+        periods: tuple[tuple[int, int], ...],
+    ) -> dict[tuple[int, int], dict[str, Any]]:
         period_lookup = {quarter_end_date(year, quarter): (year, quarter) for year, quarter in periods}
+        if not period_lookup:
+            return {}
+        oldest = min(period_lookup)
         rows = {}
         for row in self.list_call_reports(cert):
             repdte = str(row.get("REPDTE", ""))
             if repdte in period_lookup:
                 rows[period_lookup[repdte]] = row
+                if len(rows) == len(period_lookup):
+                    break
+            elif repdte and repdte < oldest:
+                break
         return rows
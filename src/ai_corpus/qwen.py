@@ -41,6 +41,9 @@ class QwenAnswerGenerator:
         self._active_model: str | None = None
         self._torch: Any | None = None
         self._device = "cpu"
+        self._session = requests.Session()
+        if self.hf_token:
+            self._session.headers.update({"Authorization": f"Bearer {self.hf_token}"})
 
     @property
     def active_model(self) -> str | None:
@@ -187,12 +190,8 @@ class QwenAnswerGenerator:
     ) -> dict[str, Any]:
         if not self.hf_token:
             raise QwenGenerationError("HF_TOKEN is required for remote generation")
-        response = requests.post(
+        response = self._session.post(
             "https://router.huggingface.co/v1/chat/completions",
-            headers={
-                "Authorization": f"Bearer {self.hf_token}",
-                "Content-Type": "application/json",
-            },
             json={
                 "model": self.model_candidates[0],
                 "messages": messages,
@@ -34,6 +34,9 @@ class HuggingFaceBackend(LLMBackend):
         self.max_retries = max_retries
         self.local = local
         self.url = "https://router.huggingface.co/v1/chat/completions"
+        self.session = requests.Session()
+        if token:
+            self.session.headers.update({"Authorization": f"Bearer {token}"})
         self.local_device = local_device
         self.local_max_new_tokens = local_max_new_tokens
         self.local_max_input_tokens = local_max_input_tokens
@@ -321,10 +324,6 @@ class HuggingFaceBackend(LLMBackend):
         if not self.token:
             raise BackendError("HF token is required for remote Hugging Face requests")
 
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json",
-        }
         payload = {
             "model": self.model,
             "messages": [
@@ -347,9 +346,8 @@ class HuggingFaceBackend(LLMBackend):
         last_error: Exception | None = None
         for attempt in range(1, self.max_retries + 1):
             try:
-                response = requests.post(
+                response = self.session.post(
                     self.url,
-                    headers=headers,
                     json=payload,
                     timeout=self.timeout_seconds,
                 )
@@ -7,18 +7,24 @@ from pathlib import Path
 from zipfile import ZipFile
 
 import pandas as pd
+import requests
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from src.ai_corpus.cleaning import clean_sec_html
 from src.ai_corpus.config import CorpusPaths
-from src.ai_corpus.models import AskResult
+from src.ai_corpus.models import AskResult, ManifestRow
+from src.ai_corpus import pipeline
 from src.ai_corpus.pipeline import (
+    acquire_missing,
     ask,
     build_index,
     build_manifest,
     build_topic_findings,
+    discover_manual_documents,
+    has_ai_anchor,
     normalize_corpus,
     optimize_prompts,
     search,
@@ -95,6 +101,46 @@ def build_fixture_workspace(tmp_path: Path) -> CorpusPaths:
     )
 
 
+def test_clean_sec_html_drops_hidden_xbrl_and_keeps_visible_text() -> None:
+    raw = (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        "<html><head><style>p { color: red; }</style></head><body>"
+        '<div style="display: none"><ix:header><ix:hidden>dei:EntityCentralIndexKey</ix:hidden></ix:header></div>'
+        '<div style="DISPLAY : None;">Hidden cover page text</div>'
+        '<p style="Display:none">Hidden footnote</p>'
+        '<p>We expanded <ix:nonNumeric name="us-gaap:Policy">artificial intelligence</ix:nonNumeric> pilots<!-- Workiva --> &amp; tools.</p>'
+        "<table><tr><td>Revenue</td><td>100</td></tr></table>"
+        "<script>track();</script></body></html>"
+    )
+
+    cleaned = clean_sec_html(raw)
+
+    assert cleaned == "We expanded artificial intelligence pilots & tools.\n\nRevenue 100"
+    assert clean_sec_html(raw.encode("utf-8")) == cleaned
+
+
+def test_has_ai_anchor_matches_whole_terms_only() -> None:
+    assert has_ai_anchor("Management expanded GenAI copilots across operations.")
+    assert has_ai_anchor("We evaluated Large Language Models for servicing.")
+    assert has_ai_anchor("New AI tools")
+    assert not has_ai_anchor("We said the aid maintained liquidity.")
+
+
+def test_clean_sec_html_keeps_text_past_parser_depth_limits() -> None:
+    unclosed_fonts = "<html><body>" + "".join(f"<p><font>para {index}" for index in range(400)) + "</body></html>"
+    assert clean_sec_html(unclosed_fonts).endswith("para 399")
+
+    too_deep = (
+        "<html><head><style>p { color: red; }</style></head><body>"
+        '<div style="display:none"><ix:header><ix:hidden>dei:EntityCentralIndexKey 0000019617</ix:hidden></ix:header></div>'
+        + "<div>" * 3000
+        + "deep text"
+        + "</div>" * 3000
+        + "<p>after</p><script>track();</script></body></html>"
+    )
+    assert clean_sec_html(too_deep) == "deep text\n\nafter"
+
+
 def test_build_manifest_tracks_available_and_missing_sources(tmp_path: Path) -> None:
     paths = build_fixture_workspace(tmp_path)
     rows = build_manifest(paths=paths, refresh_public_catalog=False)
@@ -121,6 +167,22 @@ def test_build_manifest_tracks_available_and_missing_sources(tmp_path: Path) ->
     assert mra_row.iloc[0]["status"] == "found"
 
 
+def test_discover_manual_documents_skips_hidden_and_empty_files(tmp_path: Path) -> None:
+    paths = build_fixture_workspace(tmp_path)
+    (paths.manual_source_dir / "mra_mria" / "BBB_mra_2025_Q1.txt").write_text("", encoding="utf-8")
+    (paths.manual_source_dir / "mra_mria" / ".BBB_notes.txt").write_text("hidden", encoding="utf-8")
+    (paths.manual_source_dir / "sec" / "10-K").mkdir(parents=True)
+    (paths.manual_source_dir / "sec" / "10-K" / "BBB_10-k_2025_Q4.htm.part").write_text("<html>", encoding="utf-8")
+
+    docs = discover_manual_documents(paths, {"AAA": "Alpha Bank Corp", "BBB": "Beta Bank Inc"})
+
+    names = [Path(doc.local_path).name for doc in docs]
+    assert names
+    assert "BBB_mra_2025_Q1.txt" not in names
+    assert ".BBB_notes.txt" not in names
+    assert "BBB_10-k_2025_Q4.htm.part" not in names
+
+
 def test_normalize_index_and_search_pipeline(tmp_path: Path) -> None:
     paths = build_fixture_workspace(tmp_path)
     build_manifest(paths=paths, refresh_public_catalog=False)
@@ -152,6 +214,62 @@ def test_normalize_index_and_search_pipeline(tmp_path: Path) -> None:
     assert (paths.plots_dir / "ai_maturity_quadrant.png").exists()
 
 
+def test_normalize_corpus_parallel_matches_serial_output(tmp_path: Path) -> None:
+    paths = build_fixture_workspace(tmp_path)
+    serial = normalize_corpus(paths=paths, max_workers=1)
+    serial_chunks = paths.chunks_jsonl.read_text(encoding="utf-8")
+
+    parallel = normalize_corpus(paths=paths, max_workers=2)
+
+    assert parallel == serial
+    assert paths.chunks_jsonl.read_text(encoding="utf-8") == serial_chunks
+
+
+def test_normalize_corpus_skips_duplicate_document_copies(tmp_path: Path) -> None:
+    paths = build_fixture_workspace(tmp_path)
+    baseline = normalize_corpus(paths=paths, max_workers=1)
+    copy_path = paths.manual_source_dir / "sec" / "10-K" / "AAA_10-k_2024_Q4.htm"
+    copy_path.parent.mkdir(parents=True)
+    copy_path.write_text(
+        "<html><head><title></title></head><body><h1>AI Strategy</h1>"
+        "<p>We are expanding generative AI in fraud and service.</p></body></html>",
+        encoding="utf-8",
+    )
+
+    summary = normalize_corpus(paths=paths, max_workers=1)
+
+    assert summary["duplicate_documents"] == baseline["duplicate_documents"] + 1
+    assert summary["chunk_count"] == baseline["chunk_count"]
+
+    other_bank_copy = paths.manual_source_dir / "sec" / "10-K" / "BBB_10-k_2024_Q4.htm"
+    other_bank_copy.write_text(copy_path.read_text(encoding="utf-8"), encoding="utf-8")
+    cross_bank = normalize_corpus(paths=paths, max_workers=1)
+    assert cross_bank["duplicate_documents"] == summary["duplicate_documents"]
+    assert cross_bank["normalized_documents"] > summary["normalized_documents"]
+
+
+def test_build_index_only_embeds_changed_chunks(tmp_path: Path) -> None:
+    paths = build_fixture_workspace(tmp_path)
+    normalize_corpus(paths=paths, max_workers=1)
+    first = build_index(paths=paths, embedding_model="hash")
+    assert first["embedded_chunk_count"] == first["chunk_count"] > 0
+
+    second = build_index(paths=paths, embedding_model="hash")
+    assert second["chunk_count"] == first["chunk_count"]
+    assert second["embedded_chunk_count"] == 0
+
+    rows = [json.loads(line) for line in paths.chunks_jsonl.read_text(encoding="utf-8").splitlines()]
+    changed = next(row for row in rows if "artificial intelligence" in row["chunk_text"])
+    changed["chunk_text"] += " Generative AI pilots expanded."
+    changed["content_hash"] = "changed"
+    paths.chunks_jsonl.write_text("".join(json.dumps(row) + "\n" for row in rows), encoding="utf-8")
+    third = build_index(paths=paths, embedding_model="hash")
+    assert third["embedded_chunk_count"] == 1
+
+    rebuilt = build_index(paths=paths, embedding_model="hash", rebuild=True)
+    assert rebuilt["embedded_chunk_count"] == rebuilt["chunk_count"]
+
+
 def test_ask_uses_retrieval_and_returns_citations(tmp_path: Path, monkeypatch) -> None:
     paths = build_fixture_workspace(tmp_path)
     build_manifest(paths=paths, refresh_public_catalog=False)
@@ -186,3 +304,97 @@ def test_optimize_prompts_writes_artifact(tmp_path: Path) -> None:
     artifact = optimize_prompts(paths=paths)
     assert artifact["selected_template_name"]
     assert (paths.output_dir / "compiled_prompt.json").exists()
+
+
+class StubSecClient:
+    def __init__(self, *, cache_dir: Path, missing_urls: set[str]) -> None:
+        self.missing_urls = missing_urls
+        self.fetched: list[str] = []
+
+    def download_documents(self, targets: list[tuple[str, Path]]) -> dict[Path, Exception | None]:
+        outcomes: dict[Path, Exception | None] = {}
+        for url, target in targets:
+            self.fetched.append(url)
+            if url in self.missing_urls:
+                response = requests.Response()
+                response.status_code = 404
+                outcomes[target] = requests.HTTPError(f"404 Client Error for url: {url}", response=response)
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text("<html><body>filing</body></html>", encoding="utf-8")
+            outcomes[target] = None
+        return outcomes
+
+
+class StubFdicClient:
+    def fetch_json_many(self, urls: list[str]) -> dict[str, object]:
+        return {}
+
+
+def test_acquire_missing_records_and_skips_permanent_failures(tmp_path: Path, monkeypatch) -> None:
+    paths = build_fixture_workspace(tmp_path)
+    paths.manifest_csv.parent.mkdir(parents=True, exist_ok=True)
+    archive = "https://www.sec.gov/Archives/edgar/data/1"
+    multi_urls = [f"{archive}/000000000125000001/a10k.htm", f"{archive}/000000000125000002/a10ka.htm"]
+    gone_url = f"{archive}/000000000125000003/b10q.htm"
+    existing_url = f"{archive}/000000000125000004/b8k.htm"
+    rows = [
+        ("AAA", "10-K", 2024, 4, multi_urls),
+        ("BBB", "10-Q", 2025, 1, [gone_url]),
+        ("BBB", "8-K", 2025, 2, [existing_url]),
+    ]
+    pd.DataFrame(
+        [
+            ManifestRow(
+                ticker=ticker,
+                bank_name=f"{ticker} Bank",
+                source_type="sec_filing",
+                form_type=form_type,
+                period_year=year,
+                period_quarter=quarter,
+                period_label=f"{year}_Q{quarter}",
+                expected_doc_count=len(urls),
+                observed_doc_count=0,
+                status="missing",
+                status_detail="",
+                storage_kind="",
+                local_refs="",
+                source_urls="|".join(urls),
+                manual_search_hint="",
+                notes="",
+            ).as_dict()
+            for ticker, form_type, year, quarter, urls in rows
+        ]
+    ).to_csv(paths.manifest_csv, index=False)
+    existing_target = paths.manual_source_dir / "sec" / "8-K" / "BBB_8_k_2025_Q2.htm"
+    existing_target.parent.mkdir(parents=True, exist_ok=True)
+    existing_target.write_text("<html><body>already here</body></html>", encoding="utf-8")
+
+    clients: list[StubSecClient] = []
+
+    def make_sec_client(*, cache_dir: Path) -> StubSecClient:
+        clients.append(StubSecClient(cache_dir=cache_dir, missing_urls={gone_url}))
+        return clients[-1]
+
+    monkeypatch.setattr(pipeline, "SecClient", make_sec_client)
+    monkeypatch.setattr(pipeline, "FdicClient", StubFdicClient)
+    monkeypatch.setattr(pipeline, "build_manifest", lambda **kwargs: None)
+
+    first_logs = {log.form_type: log for log in acquire_missing(paths=paths)}
+    assert sorted(clients[0].fetched) == sorted([*multi_urls, gone_url])
+    assert first_logs["10-K"].saved_path.split(" | ") == [
+        str(paths.manual_source_dir / "sec" / "10-K" / "AAA_10_k_2024_Q4_000000000125000001.htm"),
+        str(paths.manual_source_dir / "sec" / "10-K" / "AAA_10_k_2024_Q4_000000000125000002.htm"),
+    ]
+    assert first_logs["10-Q"].outcome == "not_found"
+    assert "404" in first_logs["10-Q"].notes
+    assert first_logs["8-K"].saved_path == str(existing_target)
+    failures = json.loads(paths.download_failures_json.read_text(encoding="utf-8"))
+    assert list(failures) == [gone_url]
+    assert failures[gone_url].startswith("HTTP 404")
+
+    second_logs = {log.form_type: log for log in acquire_missing(paths=paths)}
+    assert clients[1].fetched == []
+    assert second_logs["10-Q"].outcome == "not_found"
+    assert second_logs["10-Q"].notes == f"Skipped known failure: {failures[gone_url]}"
+    assert second_logs["10-K"].outcome == "downloaded"
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+MODULE_PATH = ROOT / "scripts" / "build_april1_ai_team_deliverables.py"
+SPEC = importlib.util.spec_from_file_location("build_april1_ai_team_deliverables", MODULE_PATH)
+MODULE = importlib.util.module_from_spec(SPEC)
+assert SPEC is not None and SPEC.loader is not None
+sys.modules[SPEC.name] = MODULE
+SPEC.loader.exec_module(MODULE)
+
+
+def build_frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "ticker": ["JPM", "a,b", None],
+            "score": [1.5, 1e-7, np.nan],
+            "ratio": np.array([0.1, 0.25, 0.5], dtype="float32"),
+            "count": [1, 2, 3],
+            "flag": [True, False, True],
+        }
+    )
+
+
+def test_write_frame_csv_keeps_pandas_format_for_small_frames(tmp_path: Path) -> None:
+    frame = build_frame()
+    written = tmp_path / "written.csv"
+    expected = tmp_path / "expected.csv"
+
+    MODULE.write_frame_csv(frame, written)
+    frame.to_csv(expected, index=False)
+
+    assert written.read_bytes() == expected.read_bytes()
+
+
+def test_write_frame_csv_uses_arrow_for_large_frames(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(MODULE, "ARROW_CSV_MIN_ROWS", 1)
+    frame = build_frame()
+    written = tmp_path / "written.csv"
+
+    MODULE.write_frame_csv(frame, written)
+
+    assert written.read_text(encoding="utf-8").startswith('"ticker","score"')
+    pd.testing.assert_frame_equal(pd.read_csv(written), frame, check_dtype=False, atol=1e-6)
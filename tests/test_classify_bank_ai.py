@@ -20,6 +20,25 @@ def test_normalize_company_name() -> None:
     assert MODULE.normalize_company_name("CITIGROUP INC") == "Citigroup Inc"
 
 
+def test_derive_bank_names_reads_submission_header(tmp_path: Path) -> None:
+    sec_zip_path = tmp_path / "sec.zip"
+    padding = "FILER:\n" * 1000
+    with ZipFile(sec_zip_path, "w") as archive:
+        archive.writestr("aaa.txt", "<SEC-HEADER>\nCOMPANY CONFORMED NAME: ALPHA BANK CORP\n" + padding)
+        archive.writestr("bbb.txt", padding + "COMPANY CONFORMED NAME: BETA BANK INC\n")
+        archive.writestr("ccc.txt", "no header here")
+    full_by_ticker = {
+        "AAA": {"2024_Q4": "aaa.txt"},
+        "BBB": {"2024_Q4": "bbb.txt"},
+        "CCC": {"2024_Q4": "ccc.txt"},
+    }
+
+    with ZipFile(sec_zip_path) as sec_zip:
+        names = MODULE.derive_bank_names(sec_zip, full_by_ticker)
+
+    assert names == {"AAA": "Alpha Bank Corp", "BBB": "Beta Bank Inc", "CCC": "CCC"}
+
+
 def test_clean_10k_html_removes_hidden_and_tags() -> None:
     raw = """
     <html>
@@ -82,6 +101,29 @@ def test_apply_percentile_normalization_bounds() -> None:
     assert rows[1].AI_Score_Normalized == 10.0
 
 
+def test_apply_percentile_normalization_averages_tied_ranks() -> None:
+    rows = [
+        MODULE.BankOutputRow(
+            Bank=name,
+            Ticker=name,
+            AI_Score=score,
+            Rule_AI_Score=score,
+            LLM_AI_Score=score,
+            AI_Score_Normalized=0.0,
+            Evidence="x",
+            Evidence_Source="none",
+            signal_count=0,
+            llm_confidence=0.0,
+            missing_sources="none",
+            num_transcripts=1,
+            num_10k_docs=1,
+        )
+        for name, score in [("A", 5.0), ("B", 2.0), ("C", 5.0), ("D", 9.0), ("E", 5.0)]
+    ]
+    MODULE.apply_percentile_normalization(rows)
+    assert [row.AI_Score_Normalized for row in rows] == [5.5, 1.0, 5.5, 10.0, 5.5]
+
+
 def test_calibrate_llm_scores_expands_compressed_distribution() -> None:
     config = MODULE.load_config(ROOT / "config" / "scoring.yml")
     rows = [
@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.ai_corpus import public_sources
+from src.ai_corpus.public_sources import FdicClient, SecClient
+
+
+class FakeResponse:
+    def __init__(self, status_code: int = 200, text: str = "", headers: dict[str, str] | None = None) -> None:
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+
+    def json(self):
+        return json.loads(self.text)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    def iter_content(self, chunk_size: int = 1):
+        payload = self.text.encode("utf-8")
+        for start in range(0, len(payload), chunk_size):
+            yield payload[start : start + chunk_size]
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "FakeResponse":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class FakeSession:
+    def __init__(self, responses: dict[str, list[FakeResponse | Exception]]) -> None:
+        self.responses = responses
+        self.calls: list[str] = []
+        self.sent_headers: list[dict[str, str]] = []
+        self.headers: dict[str, str] = {}
+
+    def get(self, url: str, timeout: int = 30, headers: dict[str, str] | None = None, **kwargs) -> FakeResponse:
+        self.calls.append(url)
+        self.sent_headers.append(headers or {})
+        outcome = self.responses[url].pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def test_download_documents_streams_to_targets_and_captures_errors(tmp_path: Path) -> None:
+    client = SecClient(max_requests_per_second=1000)
+    client.session = FakeSession(
+        {
+            "https://www.sec.gov/a.htm": [FakeResponse(text="alpha")],
+            "https://www.sec.gov/b.htm": [ConnectionError("boom")],
+            "https://www.sec.gov/c.htm": [FakeResponse(status_code=404)],
+        }
+    )
+    alpha = tmp_path / "sec" / "AAA.htm"
+    beta = tmp_path / "sec" / "BBB.htm"
+    gamma = tmp_path / "sec" / "CCC.htm"
+
+    outcomes = client.download_documents(
+        [
+            ("https://www.sec.gov/a.htm", alpha),
+            ("https://www.sec.gov/b.htm", beta),
+            ("https://www.sec.gov/c.htm", gamma),
+            ("https://www.sec.gov/a.htm", alpha),
+        ]
+    )
+
+    assert sorted(client.session.calls) == [
+        "https://www.sec.gov/a.htm",
+        "https://www.sec.gov/b.htm",
+        "https://www.sec.gov/c.htm",
+    ]
+    assert outcomes[alpha] is None
+    assert alpha.read_text(encoding="utf-8") == "alpha"
+    assert isinstance(outcomes[beta], ConnectionError)
+    assert isinstance(outcomes[gamma], RuntimeError)
+    assert not beta.exists() and not gamma.exists()
+    assert list(tmp_path.rglob("*.part")) == []
+
+
+def test_download_documents_keeps_existing_target(tmp_path: Path) -> None:
+    client = SecClient(max_requests_per_second=1000)
+    client.session = FakeSession({"https://www.sec.gov/a.htm": [FakeResponse(text="fresh")]})
+    target = tmp_path / "AAA.htm"
+    target.write_text("stored", encoding="utf-8")
+
+    outcomes = client.download_documents([("https://www.sec.gov/a.htm", target)])
+
+    assert outcomes[target] is None
+    assert target.read_text(encoding="utf-8") == "stored"
+    assert list(tmp_path.glob("*.part")) == []
+
+
+def test_download_document_removes_partial_file_on_interrupt(tmp_path: Path) -> None:
+    class InterruptedResponse(FakeResponse):
+        def iter_content(self, chunk_size: int = 1):
+            yield b"partial"
+            raise KeyboardInterrupt
+
+    client = SecClient(max_requests_per_second=1000)
+    client.session = FakeSession({"https://www.sec.gov/a.htm": [InterruptedResponse()]})
+    target = tmp_path / "AAA.htm"
+
+    with pytest.raises(KeyboardInterrupt):
+        client._download_document("https://www.sec.gov/a.htm", target)
+
+    assert not target.exists()
+    assert list(tmp_path.glob("*.part")) == []
+
+
+def test_sec_get_retries_throttled_responses_with_backoff(monkeypatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr(public_sources.time, "sleep", sleeps.append)
+    client = SecClient(max_requests_per_second=1000)
+    client.session = FakeSession(
+        {
+            "https://www.sec.gov/a.htm": [
+                FakeResponse(status_code=429, headers={"Retry-After": "3"}),
+                FakeResponse(status_code=503),
+                FakeResponse(status_code=429),
+                FakeResponse(text="alpha"),
+            ]
+        }
+    )
+
+    response = client._get("https://www.sec.gov/a.htm")
+
+    assert response.text == "alpha"
+    assert len(client.session.calls) == 4
+    assert [delay for delay in sleeps if delay >= 0.5] == [3.0, 1.0, 2.0]
+
+
+def test_sec_get_honours_long_retry_after_or_gives_up(monkeypatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr(public_sources.time, "sleep", sleeps.append)
+    client = SecClient(max_requests_per_second=1000)
+    client.session = FakeSession(
+        {
+            "https://www.sec.gov/a.htm": [
+                FakeResponse(status_code=429, headers={"Retry-After": "20"}),
+                FakeResponse(text="alpha"),
+            ],
+            "https://www.sec.gov/b.htm": [FakeResponse(status_code=503, headers={"Retry-After": "600"})],
+        }
+    )
+
+    assert client._get("https://www.sec.gov/a.htm").text == "alpha"
+    assert 20.0 in sleeps
+
+    response = client._get("https://www.sec.gov/b.htm")
+    assert response.status_code == 503
+    assert client.session.calls.count("https://www.sec.gov/b.htm") == 1
+
+
+def test_sec_get_returns_last_throttled_response_after_max_attempts(monkeypatch) -> None:
+    monkeypatch.setattr(public_sources.time, "sleep", lambda _: None)
+    client = SecClient(max_requests_per_second=1000)
+    client.session = FakeSession(
+        {"https://www.sec.gov/a.htm": [FakeResponse(status_code=429) for _ in range(public_sources.RETRY_MAX_ATTEMPTS)]}
+    )
+
+    response = client._get("https://www.sec.gov/a.htm")
+
+    assert response.status_code == 429
+    assert len(client.session.calls) == public_sources.RETRY_MAX_ATTEMPTS
+
+
+def test_ticker_map_is_served_from_disk_cache(tmp_path: Path) -> None:
+    payload = json.dumps({"0": {"cik_str": 123, "ticker": "aaa", "title": "Alpha Bank Corp"}})
+    first = SecClient(max_requests_per_second=1000, cache_dir=tmp_path)
+    first.session = FakeSession({public_sources.SEC_TICKERS_URL: [FakeResponse(text=payload)]})
+    assert first.cik_for_ticker("AAA") == "0000000123"
+
+    second = SecClient(max_requests_per_second=1000, cache_dir=tmp_path)
+    second.session = FakeSession({})
+    assert second.cik_for_ticker("AAA") == "0000000123"
+    assert second.session.calls == []
+
+    expired = SecClient(max_requests_per_second=1000, cache_dir=tmp_path, cache_ttl_seconds=0)
+    expired.session = FakeSession({public_sources.SEC_TICKERS_URL: [FakeResponse(text=payload)]})
+    assert expired.cik_for_ticker("AAA") == "0000000123"
+    assert expired.session.calls == [public_sources.SEC_TICKERS_URL]
+
+
+def test_stale_sec_cache_is_revalidated_with_conditional_get(tmp_path: Path) -> None:
+    payload = json.dumps({"0": {"cik_str": 123, "ticker": "aaa", "title": "Alpha Bank Corp"}})
+    first = SecClient(max_requests_per_second=1000, cache_dir=tmp_path)
+    first.session = FakeSession(
+        {public_sources.SEC_TICKERS_URL: [FakeResponse(text=payload, headers={"ETag": '"v1"'})]}
+    )
+    first.ticker_map()
+    assert first.session.sent_headers == [{}]
+
+    stale = SecClient(max_requests_per_second=1000, cache_dir=tmp_path, cache_ttl_seconds=0)
+    stale.session = FakeSession({public_sources.SEC_TICKERS_URL: [FakeResponse(status_code=304)]})
+    assert stale.cik_for_ticker("AAA") == "0000000123"
+    sent = stale.session.sent_headers[0]
+    assert sent["If-None-Match"] == '"v1"'
+    assert sent["If-Modified-Since"].endswith("GMT")
+
+
+def test_fdic_fetch_json_many_dedupes_urls_and_captures_errors() -> None:
+    client = FdicClient(max_requests_per_second=1000)
+    client.session = FakeSession(
+        {
+            "https://api.fdic.gov/banks/financials?filters=CERT:1": [FakeResponse(text='{"data": []}')],
+            "https://api.fdic.gov/banks/financials?filters=CERT:2": [FakeResponse(status_code=500)],
+        }
+    )
+
+    payloads = client.fetch_json_many(
+        [
+            "https://api.fdic.gov/banks/financials?filters=CERT:1",
+            "https://api.fdic.gov/banks/financials?filters=CERT:2",
+            "https://api.fdic.gov/banks/financials?filters=CERT:1",
+        ]
+    )
+
+    assert len(client.session.calls) == 2
+    assert payloads["https://api.fdic.gov/banks/financials?filters=CERT:1"] == {"data": []}
+    assert isinstance(payloads["https://api.fdic.gov/banks/financials?filters=CERT:2"], RuntimeError)
+
+
+def test_find_call_report_rows_stops_after_oldest_requested_period() -> None:
+    client = FdicClient(max_requests_per_second=1000)
+    client._call_reports[7] = [
+        {"REPDTE": "20250630", "ASSET": 3},
+        {"REPDTE": "20250331", "ASSET": 2},
+        {"REPDTE": "20241231", "ASSET": 1},
+        {"REPDTE": "20240930", "ASSET": 0},
+    ]
+
+    rows = client.find_call_report_rows(7, ((2025, 1), (2024, 4), (2023, 4)))
+
+    assert rows == {(2025, 1): {"REPDTE": "20250331", "ASSET": 2}, (2024, 4): {"REPDTE": "20241231", "ASSET": 1}}
+    assert client.find_call_report_rows(7, ()) == {}
+
+
+def test_truncated_sec_cache_is_treated_as_a_miss(tmp_path: Path) -> None:
+    payload = json.dumps({"0": {"cik_str": 123, "ticker": "aaa", "title": "Alpha Bank Corp"}})
+    cache_path = tmp_path / "sec" / "company_tickers.json"
+    cache_path.parent.mkdir(parents=True)
+    cache_path.write_text(payload[: len(payload) // 2], encoding="utf-8")
+    cache_path.with_name("company_tickers.json.etag").write_text('{"etag": ', encoding="utf-8")
+
+    client = SecClient(max_requests_per_second=1000, cache_dir=tmp_path)
+    client.session = FakeSession({public_sources.SEC_TICKERS_URL: [FakeResponse(text=payload)]})
+
+    assert client.cik_for_ticker("AAA") == "0000000123"
+    assert client.session.sent_headers == [{}]
+    assert json.loads(cache_path.read_text(encoding="utf-8")) == json.loads(payload)
+    assert list(cache_path.parent.glob("*.tmp")) == []
+
+
+def test_sec_get_through_real_adapter_leaves_retry_after_to_client(monkeypatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr(public_sources.time, "sleep", sleeps.append)
+    hits: list[str] = []
+
+    class ThrottlingHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            hits.append(self.path)
+            self.send_response(503)
+            self.send_header("Retry-After", "600")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ThrottlingHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        client = SecClient(max_requests_per_second=1000)
+        response = client._get(f"http://127.0.0.1:{server.server_port}/a.htm")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert response.status_code == 503
+    assert hits == ["/a.htm"]
+    assert [delay for delay in sleeps if delay >= 1.0] == []